@@ -1,17 +1,25 @@
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
+import functools
 import hashlib
+import http.client
+import io
 import ssl
+import threading
 import json
+import os
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+import urllib.response
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from http.client import HTTPResponse
+import urllib3
 from rdflib import Graph
 from rdflib.plugins.sparql.parser import parseQuery
-from urllib3.filepost import encode_multipart_formdata
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
 
 
 MEDIA_TYPES = {
@@ -54,6 +62,131 @@ class RetryAfterHandler(urllib.request.BaseHandler):
         return self.parent.open(req)
 
 
+class _UnverifiedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    """HTTPS pool for an SSL context whose verification was switched off on purpose.
+
+    urllib3 warns on every request made without certificate verification;
+    urllib never did, and `verify_ssl=False` is an explicit choice. Skipping
+    the warning in the pool keeps it scoped to `PooledHTTPHandler`'s pools
+    instead of muting `InsecureRequestWarning` for the whole process.
+    """
+
+    def _validate_conn(self, conn):
+        # Same as the parent, minus the InsecureRequestWarning
+        if conn.is_closed:
+            conn.connect()
+
+
+class PooledHTTPHandler(urllib.request.HTTPHandler, urllib.request.HTTPSHandler):
+    """Sends the opener's requests through a `urllib3.PoolManager`.
+
+    urllib's own handlers open a new connection per request, with a full TLS
+    handshake for HTTPS, and send `Connection: close`. This handler sends
+    each request over a pooled keep-alive connection instead. It wraps the
+    buffered response back into urllib's response type, so the redirect,
+    retry and error handlers in the opener chain see no difference.
+
+    Proxies come from the environment (`http_proxy`, `https_proxy`,
+    `no_proxy`), as with urllib's `ProxyHandler`; proxied requests go
+    through a `urllib3.ProxyManager` per proxy.
+    """
+
+    # One retry for a connection that fails before the request is sent, or
+    # for an idempotent request whose pooled connection the server had
+    # already closed (a stale keep-alive). Redirects and Retry-After stay
+    # with the opener's handlers.
+    RETRIES = urllib3.Retry(
+        total=1,
+        connect=1,
+        read=1,
+        other=0,
+        status=0,
+        redirect=False,
+        respect_retry_after_header=False,
+    )
+
+    def __init__(self, ssl_context: ssl.SSLContext, maxsize: int = 10):
+        urllib.request.HTTPSHandler.__init__(self, context=ssl_context)
+        self.ssl_context = ssl_context
+        self.maxsize = maxsize
+        self.pool = self._configure(
+            urllib3.PoolManager(maxsize=maxsize, ssl_context=ssl_context)
+        )
+        self.proxies = urllib.request.getproxies()
+        self._proxy_pools: dict = {}
+
+    def _configure(self, manager: urllib3.PoolManager) -> urllib3.PoolManager:
+        if self.ssl_context.verify_mode == ssl.CERT_NONE:
+            manager.pool_classes_by_scheme = {
+                **manager.pool_classes_by_scheme,
+                "https": _UnverifiedHTTPSConnectionPool,
+            }
+        return manager
+
+    def _manager(self, url: str) -> urllib3.PoolManager:
+        """Pool manager for `url`: direct, or through the environment's proxy."""
+        parts = urllib.parse.urlsplit(url)
+        proxy = self.proxies.get(parts.scheme)
+        if not proxy or urllib.request.proxy_bypass(parts.hostname or ""):
+            return self.pool
+
+        manager = self._proxy_pools.get(proxy)
+        if manager is None:
+            proxy_url = proxy if "://" in proxy else f"http://{proxy}"
+            auth = urllib3.util.parse_url(proxy_url).auth
+            manager = self._configure(
+                urllib3.ProxyManager(
+                    proxy_url,
+                    maxsize=self.maxsize,
+                    ssl_context=self.ssl_context,
+                    proxy_headers=urllib3.make_headers(
+                        proxy_basic_auth=urllib.parse.unquote(auth)
+                    ) if auth else None,
+                )
+            )
+            manager = self._proxy_pools.setdefault(proxy, manager)
+        return manager
+
+    def http_open(self, req):
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        # urllib's ProxyHandler may have added this for the proxy; the
+        # ProxyManager sends its own, and it must not reach the origin
+        headers.pop("Proxy-authorization", None)
+        kwargs = {}
+        # urllib's default timeout is a private sentinel object; only pass
+        # an explicit one (a number, or None for blocking) on to urllib3
+        if req.timeout is None or isinstance(req.timeout, (int, float)):
+            kwargs["timeout"] = req.timeout
+
+        # Redirects stay with the opener's handlers; the body is preloaded
+        # so the connection goes back to the pool straight away.
+        try:
+            r = self._manager(req.full_url).urlopen(
+                req.get_method(),
+                req.full_url,
+                body=req.data,
+                headers=headers,
+                redirect=False,
+                retries=self.RETRIES,
+                preload_content=True,
+                **kwargs,
+            )
+        except urllib3.exceptions.HTTPError as err:
+            raise urllib.error.URLError(err) from err
+
+        msg = http.client.HTTPMessage()
+        for name, value in r.headers.iteritems():
+            msg[name] = value
+        response = urllib.response.addinfourl(
+            io.BytesIO(r.data), msg, req.full_url, r.status
+        )
+        response.msg = r.reason
+        return response
+
+    https_open = http_open
+
+
 class LinkedDataClient:
     def __init__(
         self,
@@ -82,9 +215,9 @@ class LinkedDataClient:
             self.ssl_context.check_hostname = False
             self.ssl_context.verify_mode = ssl.CERT_NONE
 
-        # Create an HTTPS handler with the configured SSL context
+        # Pool connections (keep-alive) using the configured SSL context
         self.opener = urllib.request.build_opener(
-            urllib.request.HTTPSHandler(context=self.ssl_context),
+            PooledHTTPHandler(self.ssl_context),
             HTTPRedirectHandler308(),
             RetryAfterHandler(),
         )
@@ -196,6 +329,88 @@ class LinkedDataClient:
         return self.opener.open(request)
 
 
+@functools.lru_cache(maxsize=None)
+def shared_linked_data_client(
+    cert_pem_path: Optional[str] = None,
+    cert_password: Optional[str] = None,
+    verify_ssl: bool = True,
+) -> LinkedDataClient:
+    """Return the process-wide `LinkedDataClient` for a TLS configuration.
+
+    Operations are instantiated per call (and per nested `@op`), so building
+    a fresh client each time would recreate the SSL context — loading the
+    CA bundle and decrypting the client certificate — for every request.
+    Clients are keyed by their constructor arguments and reused instead.
+    """
+    return LinkedDataClient(
+        cert_pem_path=cert_pem_path,
+        cert_password=cert_password,
+        verify_ssl=verify_ssl,
+    )
+
+
+class MultipartBody:
+    """Re-iterable `multipart/form-data` request body that streams files from disk.
+
+    Takes the same `(name, value)` field list as urllib3's
+    `encode_multipart_formdata`, except that a file part's body is a local
+    path rather than bytes. Form fields and part headers are encoded up
+    front; file contents are only read, in `CHUNK_SIZE` blocks, while the
+    request is being sent, so memory use is bounded by the chunk size
+    rather than the file size. The body can be iterated more than once,
+    which lets `HTTPRedirectHandler308` and `RetryAfterHandler` re-send it.
+
+    Each file's sha1 is computed from the same chunks as they are sent, so
+    the file is read once per send; `sha1s` holds the hex digests, in file
+    order, once the body has been fully iterated.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, fields: List[Tuple[str, object]]):
+        boundary = choose_boundary()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        # Encoded framing and form fields, interleaved with file paths
+        self._segments: List[Union[bytes, str]] = []
+        buffer = bytearray()
+        for name, value in fields:
+            field = RequestField.from_tuples(
+                name, (value[0], b"", value[2]) if isinstance(value, tuple) else value
+            )
+            buffer += f"--{boundary}\r\n".encode("latin-1")
+            buffer += field.render_headers().encode("utf-8")
+            if isinstance(value, tuple):
+                self._segments.append(bytes(buffer))
+                self._segments.append(os.fspath(value[1]))
+                buffer = bytearray()
+            else:
+                buffer += value.encode("utf-8")
+            buffer += b"\r\n"
+        buffer += f"--{boundary}--\r\n".encode("latin-1")
+        self._segments.append(bytes(buffer))
+
+        self.content_length = sum(
+            len(segment) if isinstance(segment, bytes) else os.path.getsize(segment)
+            for segment in self._segments
+        )
+        self.sha1s: Optional[List[str]] = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        sha1s = []
+        for segment in self._segments:
+            if isinstance(segment, bytes):
+                yield segment
+            else:
+                digest = hashlib.sha1()
+                with open(segment, "rb") as f:
+                    while chunk := f.read(self.CHUNK_SIZE):
+                        digest.update(chunk)
+                        yield chunk
+                sha1s.append(digest.hexdigest())
+        self.sha1s = sha1s
+
+
 class FileClient:
     """Multipart RDF/POST file upload for LinkedDataHub file resources.
 
@@ -240,7 +455,7 @@ class FileClient:
             self.ssl_context.verify_mode = ssl.CERT_NONE
 
         self.opener = urllib.request.build_opener(
-            urllib.request.HTTPSHandler(context=self.ssl_context),
+            PooledHTTPHandler(self.ssl_context),
             HTTPRedirectHandler308(),
             RetryAfterHandler(),
         )
@@ -255,7 +470,7 @@ class FileClient:
     def add_file(
         self,
         target_url: str,
-        file_body: bytes,
+        file_path: str,
         content_type: str,
         title: str,
         description: Optional[str] = None,
@@ -267,51 +482,130 @@ class FileClient:
             appended to. Note this is *not* the URI the file ends up at —
             LDH stores the bytes under its own `/uploads/{sha1}` namespace
             regardless of `target_url`.
-        :param file_body: Raw file bytes.
+        :param file_path: Local path of the file. Its contents are streamed
+            into the request body rather than read into memory up front.
         :param content_type: MIME type of the file (e.g. `image/png`).
         :param title: `dct:title` literal.
         :param description: Optional `dct:description` literal.
         :param filename: Optional filename for the multipart part's
-            `Content-Disposition`. Defaults to `"upload"` when absent;
+            `Content-Disposition`. Defaults to the basename of `file_path`;
             LDH does not depend on this value for URI minting.
-        :return: `(HTTPResponse, sha1_hex)`. The sha1 is computed over
-            `file_body` client-side so callers can construct the resulting
+        :return: `(HTTPResponse, sha1_hex)`. The sha1 is computed over the
+            file contents client-side so callers can construct the resulting
             `<base>/uploads/{sha1}` URI without parsing the response body.
         """
-        sha1 = hashlib.sha1(file_body).hexdigest()
-
-        # `encode_multipart_formdata` accepts a list of `(name, value)`
-        # tuples — duplicates allowed, order preserved. A plain string/bytes
-        # value becomes a form field; a `(filename, body, content_type)`
-        # tuple becomes a file part. RDF/POST relies on this ordering
-        # because each `pu=<predicate>` field is paired with the next
-        # `ol=<literal>` / `ou=<uri>` field by LDH's parser.
-        fields: list[tuple[str, object]] = [
-            ("rdf", ""),
-            ("sb", "file"),
-            ("pu", self._NFO_FILE_NAME),
-            ("ol", (filename or "upload", file_body, content_type)),
-            ("pu", self._DCT_TITLE),
-            ("ol", title),
-            ("pu", self._RDF_TYPE),
-            ("ou", self._NFO_FILE_DATA_OBJECT),
+        response, sha1s = self.add_files(
+            target_url,
+            [
+                {
+                    "file_path": file_path,
+                    "content_type": content_type,
+                    "title": title,
+                    "description": description,
+                    "filename": filename,
+                }
+            ],
+        )
+        return response, sha1s[0]
+
+    def add_files(
+        self, target_url: str, files: List[dict]
+    ) -> Tuple[HTTPResponse, List[str]]:
+        """RDF/POST several files to `target_url` in a single multipart request.
+
+        :param target_url: The document URI the files' RDF descriptions are
+            appended to.
+        :param files: One dict per file with the keyword arguments of
+            `add_file` (`file_path`, `content_type`, `title` and optional
+            `description` / `filename`).
+        :return: `(HTTPResponse, [sha1_hex, ...])`, sha1s in `files` order.
+
+        Each file gets its own blank-node subject (`sb=file{i}`). LDH pairs
+        every multipart file part with the resource whose `nfo:fileName`
+        equals the part's filename, so filenames must be distinct within one
+        request.
+        """
+        filenames = [
+            f.get("filename") or os.path.basename(f["file_path"]) for f in files
         ]
-        if description:
+        if len(set(filenames)) != len(filenames):
+            raise ValueError(
+                f"Cannot RDF/POST files with duplicate filenames in one request: {filenames}"
+            )
+
+        # `MultipartBody` accepts a list of `(name, value)` tuples —
+        # duplicates allowed, order preserved. A plain string value becomes
+        # a form field; a `(filename, path, content_type)` tuple becomes a
+        # file part. RDF/POST relies on this ordering because each
+        # `pu=<predicate>` field is paired with the next `ol=<literal>` /
+        # `ou=<uri>` field by LDH's parser.
+        fields: list[tuple[str, object]] = [("rdf", "")]
+        for i, (file, filename) in enumerate(zip(files, filenames)):
             fields.extend([
-                ("pu", self._DCT_DESCRIPTION),
-                ("ol", description),
+                ("sb", f"file{i}"),
+                ("pu", self._NFO_FILE_NAME),
+                ("ol", (filename, file["file_path"], file["content_type"])),
+                ("pu", self._DCT_TITLE),
+                ("ol", file["title"]),
+                ("pu", self._RDF_TYPE),
+                ("ou", self._NFO_FILE_DATA_OBJECT),
             ])
-
-        body, content_type_header = encode_multipart_formdata(fields)
+            if file.get("description"):
+                fields.extend([
+                    ("pu", self._DCT_DESCRIPTION),
+                    ("ol", file["description"]),
+                ])
+
+        body = MultipartBody(fields)
+        # An explicit Content-Length keeps urllib from falling back to
+        # chunked transfer encoding for the iterable body.
         headers = {
-            "Content-Type": content_type_header,
+            "Content-Type": body.content_type,
+            "Content-Length": str(body.content_length),
             "Accept": "text/turtle",
         }
         request = urllib.request.Request(
             target_url, data=body, headers=headers, method="POST"
         )
         response = self.opener.open(request)
-        return response, sha1
+        # The request has been sent in full, so the body has hashed every file
+        return response, body.sha1s
+
+
+@functools.lru_cache(maxsize=None)
+def shared_file_client(
+    cert_pem_path: Optional[str] = None,
+    cert_password: Optional[str] = None,
+    verify_ssl: bool = True,
+) -> FileClient:
+    """Return the process-wide `FileClient` for a TLS configuration.
+
+    See `shared_linked_data_client`.
+    """
+    return FileClient(
+        cert_pem_path=cert_pem_path,
+        cert_password=cert_password,
+        verify_ssl=verify_ssl,
+    )
+
+
+# rdflib's pyparsing grammar is not safe to use from several threads at once:
+# pyparsing fixes up each parse action on its first call, and concurrent first
+# parses fail and can leave the grammar broken for the rest of the process
+_PARSE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=256)
+def _query_type(query_string: str) -> str:
+    """Form of a SPARQL query, e.g. 'SelectQuery' or 'ConstructQuery'.
+
+    Only used to pick the Accept header, but it takes a full pyparsing
+    parse (tens of milliseconds for the schema extraction queries), so the
+    answer is cached per query text; fixed queries are parsed once. Parses
+    are serialised, as clients are shared across threads.
+    """
+    with _PARSE_LOCK:
+        return parseQuery(query_string)[1].name
 
 
 class SPARQLClient:
@@ -343,7 +637,7 @@ class SPARQLClient:
             self.ssl_context.verify_mode = ssl.CERT_NONE
 
         self.opener = urllib.request.build_opener(
-            urllib.request.HTTPSHandler(context=self.ssl_context),
+            PooledHTTPHandler(self.ssl_context),
             RetryAfterHandler(),
         )
 
@@ -355,16 +649,15 @@ class SPARQLClient:
             )
         ]
 
-    def query(self, endpoint_url: str, query_string: str) -> dict:
+    def query(self, endpoint_url: str, query_string: str) -> Union[Graph, dict]:
         """
-        Executes a SPARQL query. Returns Graph for CONSTRUCT/DESCRIBE, Result for SELECT/ASK.
+        Executes a SPARQL query. Returns Graph for CONSTRUCT/DESCRIBE, SPARQL results JSON for SELECT/ASK.
 
         :param endpoint_url: The SPARQL endpoint URL
         :param query_string: SPARQL query string
-        :return: rdflib.Graph or rdflib.query.Result
+        :return: rdflib.Graph or SPARQL results JSON dict
         """
-        parsed = parseQuery(query_string)
-        query_type = parsed[1].name  # e.g., 'SelectQuery', 'ConstructQuery'
+        query_type = _query_type(query_string)
 
         if query_type in {"SelectQuery", "AskQuery"}:
             accept = "application/sparql-results+json"
@@ -380,15 +673,33 @@ class SPARQLClient:
 
         request = urllib.request.Request(url, headers=headers)
         response = self.opener.open(request)
-        data = response.read()
 
         if accept == "application/n-triples":
+            # N-Triples is the cheapest format to parse; hand back the Graph
+            # itself rather than a JSON-LD rendering of it. PooledHTTPHandler
+            # has already buffered the whole body; parsing from the response
+            # object reads that buffer line by line instead of first decoding
+            # it into a second, full-size str
             g = Graph()
-            # convert N-Triples to JSON-LD
-            g.parse(data=data.decode("utf-8"), format="nt")
-            jsonld_str = g.serialize(format="json-ld")
-            jsonld_data = json.loads(jsonld_str)
-            return jsonld_data
+            g.parse(source=response, format="nt")
+            return g
         else:
             # return SPARQL JSON results as a dict
-            return json.loads(data.decode("utf-8"))
+            return json.load(response)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_sparql_client(
+    cert_pem_path: Optional[str] = None,
+    cert_password: Optional[str] = None,
+    verify_ssl: bool = True,
+) -> SPARQLClient:
+    """Return the process-wide `SPARQLClient` for a TLS configuration.
+
+    See `shared_linked_data_client`.
+    """
+    return SPARQLClient(
+        cert_pem_path=cert_pem_path,
+        cert_password=cert_password,
+        verify_ssl=verify_ssl,
+    )
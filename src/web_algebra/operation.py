@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import functools
 import json
 import logging
 from typing import Type, Dict, Optional, Any, List, ClassVar, Union
@@ -46,6 +47,15 @@ class Operation(ABC, BaseModel):
     def inputSchema(cls) -> dict:
         pass
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def required_arguments(cls) -> frozenset:
+        """Names listed as `required` in the operation's `inputSchema()`.
+
+        Cached per class, as `inputSchema()` builds a fresh dict on every call.
+        """
+        return frozenset(cls.inputSchema().get("required", ()))
+
     @abstractmethod
     def execute(self, *args) -> Union[Node, Result, Graph]:
         """Pure function: RDFLib terms → RDFLib terms/Results/Graphs"""
@@ -93,6 +103,15 @@ class Operation(ABC, BaseModel):
                 if not operation_cls:
                     raise ValueError(f"Unknown operation: {op_name}")
 
+                # Fail before any argument is evaluated — nested `@op`s may
+                # have side effects (HTTP writes) that a later KeyError
+                # would leave half-done.
+                missing = operation_cls.required_arguments().difference(op_args)
+                if missing:
+                    raise ValueError(
+                        f"Operation {op_name} is missing required arguments: {sorted(missing)}"
+                    )
+
                 operation = operation_cls(settings=settings, context=context)
                 result = operation.execute_json(op_args, variable_stack)
 
@@ -233,8 +252,11 @@ class Operation(ABC, BaseModel):
         if isinstance(data, Graph):
             return data
         if isinstance(data, (dict, list)):
+            # rdflib reads a dict document as is; only a top-level array has
+            # to be dumped to a JSON string first
+            source = data if isinstance(data, dict) else json.dumps(data)
             graph = Graph()
-            graph.parse(data=json.dumps(data), format="json-ld", publicID=base)
+            graph.parse(data=source, format="json-ld", publicID=base)
             return graph
         raise TypeError(
             f"Cannot convert {type(data).__name__} to Graph; "
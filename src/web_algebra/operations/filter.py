@@ -1,6 +1,7 @@
 from typing import Any, Union
 from mcp import types
 from web_algebra.operation import Operation
+from web_algebra.json_result import JSONResult
 
 
 class Filter(Operation):
@@ -104,8 +105,6 @@ class Filter(Operation):
         """MCP execution: plain args → plain results"""
         # Convert plain args to RDFLib terms
         input_json = arguments["input"]
-        from web_algebra.json_result import JSONResult
-
         input_result = JSONResult.from_json(input_json)
         expression = arguments["expression"]
 
@@ -4,7 +4,7 @@ from typing import Any
 from mcp import types
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
-from web_algebra.client import LinkedDataClient
+from web_algebra.client import shared_linked_data_client
 
 
 class GET(Operation, MCPTool):
@@ -15,7 +15,7 @@ class GET(Operation, MCPTool):
     """
 
     def model_post_init(self, __context: Any) -> None:
-        self.client = LinkedDataClient(
+        self.client = shared_linked_data_client(
             cert_pem_path=getattr(self.settings, "cert_pem_path", None),
             cert_password=getattr(self.settings, "cert_password", None),
             verify_ssl=False,  # Optionally disable SSL verification
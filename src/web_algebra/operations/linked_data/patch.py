@@ -5,8 +5,9 @@ from rdflib.namespace import XSD
 from mcp import types
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
+from web_algebra.json_result import JSONResult
 from rdflib.query import Result
-from web_algebra.client import LinkedDataClient
+from web_algebra.client import shared_linked_data_client
 
 
 class PATCH(Operation, MCPTool):
@@ -21,7 +22,7 @@ class PATCH(Operation, MCPTool):
     """
 
     def model_post_init(self, __context: Any) -> None:
-        self.client = LinkedDataClient(
+        self.client = shared_linked_data_client(
             cert_pem_path=getattr(self.settings, "cert_pem_path", None),
             cert_password=getattr(self.settings, "cert_password", None),
             verify_ssl=False,  # Optionally disable SSL verification
@@ -77,8 +78,6 @@ class PATCH(Operation, MCPTool):
         logging.info("PATCH operation status: %s", response.status)
 
         # Return SPARQL results format
-        from web_algebra.json_result import JSONResult
-
         return JSONResult(
             vars=["status", "url"],
             bindings=[
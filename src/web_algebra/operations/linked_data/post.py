@@ -5,8 +5,9 @@ from rdflib.namespace import XSD
 from mcp import types
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
+from web_algebra.json_result import JSONResult
 from rdflib.query import Result
-from web_algebra.client import LinkedDataClient
+from web_algebra.client import shared_linked_data_client
 
 
 class POST(Operation, MCPTool):
@@ -19,7 +20,7 @@ class POST(Operation, MCPTool):
     """
 
     def model_post_init(self, __context: Any) -> None:
-        self.client = LinkedDataClient(
+        self.client = shared_linked_data_client(
             cert_pem_path=getattr(self.settings, "cert_pem_path", None),
             cert_password=getattr(self.settings, "cert_password", None),
             verify_ssl=False,  # Optionally disable SSL verification
@@ -67,8 +68,6 @@ class POST(Operation, MCPTool):
         logging.info("POST operation status: %s", response.status)
 
         # Return SPARQL results format
-        from web_algebra.json_result import JSONResult
-
         return JSONResult(
             vars=["status", "url"],
             bindings=[
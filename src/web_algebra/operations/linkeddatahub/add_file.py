@@ -1,6 +1,7 @@
 from typing import Any, Optional
 import logging
 import mimetypes
+import os
 import urllib.parse
 from pathlib import Path
 
@@ -9,7 +10,7 @@ from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
 from rdflib.query import Result
 
-from web_algebra.client import FileClient
+from web_algebra.client import shared_file_client
 from web_algebra.json_result import JSONResult
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
@@ -25,12 +26,12 @@ class AddFile(Operation, MCPTool):
 
     Unlike the rest of the `ldh-Add*` family, this op does not subclass
     `POST` — file upload uses `multipart/form-data` with LDH's RDF/POST
-    dialect rather than an N-triples body, so it carries its own
-    `FileClient` instance instead of inheriting `LinkedDataClient` plumbing.
+    dialect rather than an N-triples body, so it uses a shared
+    `FileClient` instead of inheriting `LinkedDataClient` plumbing.
     """
 
     def model_post_init(self, __context: Any) -> None:
-        self.client = FileClient(
+        self.client = shared_file_client(
             cert_pem_path=getattr(self.settings, "cert_pem_path", None),
             cert_password=getattr(self.settings, "cert_password", None),
             verify_ssl=False,
@@ -50,8 +51,8 @@ class AddFile(Operation, MCPTool):
 
         Arguments:
         - `url` — URI of the target document to add the file's description to.
-        - `file` — absolute local file path. The bytes are read and streamed
-          to the server.
+        - `file` — absolute local file path. The bytes are streamed to the
+          server.
         - `title` — human-readable title (`dct:title`).
         - `description` — optional description (`dct:description`).
         - `content_type` — optional MIME-type override; auto-detected from
@@ -91,6 +92,26 @@ class AddFile(Operation, MCPTool):
             "required": ["url", "file", "title"],
         }
 
+    @staticmethod
+    def guess_content_type(path_str: str, content_type: Optional[Literal]) -> str:
+        """Explicit `content_type` if given, else guessed from the path."""
+        ct: Optional[str] = str(content_type) if content_type is not None else None
+        if ct is None:
+            ct, _ = mimetypes.guess_type(path_str)
+        if ct is None:
+            ct = "application/octet-stream"
+        return ct
+
+    @staticmethod
+    def upload_uri(url_str: str, sha1: str) -> str:
+        """The minted file URI lives at `<scheme>://<host>/uploads/<sha1>`
+        regardless of which target document we RDF/POSTed to. Reconstruct
+        from the target URL's host so callers don't need to thread the
+        base URL through separately.
+        """
+        parsed = urllib.parse.urlparse(url_str)
+        return f"{parsed.scheme}://{parsed.netloc}/uploads/{sha1}"
+
     def execute(
         self,
         url: URIRef,
@@ -122,36 +143,24 @@ class AddFile(Operation, MCPTool):
             )
 
         path_str = str(file_path)
-        with open(path_str, "rb") as f:
-            body = f.read()
-
-        ct: Optional[str] = str(content_type) if content_type is not None else None
-        if ct is None:
-            ct, _ = mimetypes.guess_type(path_str)
-        if ct is None:
-            ct = "application/octet-stream"
+        ct = self.guess_content_type(path_str, content_type)
 
         url_str = str(url)
         logging.info(
             "RDF/POSTing file %s (%d bytes, %s) to <%s>",
-            path_str, len(body), ct, url_str,
+            path_str, os.path.getsize(path_str), ct, url_str,
         )
 
         response, sha1 = self.client.add_file(
             target_url=url_str,
-            file_body=body,
+            file_path=path_str,
             content_type=ct,
             title=str(title),
             description=str(description) if description is not None else None,
             filename=Path(path_str).name,
         )
 
-        # The minted file URI lives at `<scheme>://<host>/uploads/<sha1>`
-        # regardless of which target document we RDF/POSTed to. Reconstruct
-        # from the target URL's host so callers don't need to thread the
-        # base URL through separately.
-        parsed = urllib.parse.urlparse(url_str)
-        file_uri = f"{parsed.scheme}://{parsed.netloc}/uploads/{sha1}"
+        file_uri = self.upload_uri(url_str, sha1)
 
         logging.info("AddFile status %s → <%s>", response.status, file_uri)
 
@@ -0,0 +1,199 @@
+from typing import Any, Optional
+import logging
+import os
+from pathlib import Path
+
+from mcp import types
+from rdflib import Literal, URIRef
+from rdflib.namespace import XSD
+from rdflib.query import Result
+
+from web_algebra.json_result import JSONResult
+from web_algebra.operation import Operation
+from web_algebra.operations.linkeddatahub.add_file import AddFile
+
+
+class AddFiles(AddFile):
+    """RDF/POST several files to a LinkedDataHub document in one request.
+
+    Same wire format as `ldh-AddFile`, but every file's description and
+    bytes travel in a single `multipart/form-data` body, so N uploads cost
+    one round-trip (and one TLS handshake) instead of N.
+    """
+
+    @classmethod
+    def name(cls):
+        return "ldh-AddFiles"
+
+    @classmethod
+    def description(cls) -> str:
+        return """Adds several files to a LinkedDataHub document via a single multipart RDF/POST.
+
+        Equivalent to calling `ldh-AddFile` once per file, but all files are
+        sent in one request.
+
+        Arguments:
+        - `url` — URI of the target document to add the files' descriptions to.
+        - `files` — list of files, each with `file` (absolute local path),
+          `title` and optional `description` / `content_type`. Filenames
+          must be distinct, as LDH pairs file parts with their descriptions
+          by filename.
+
+        Returns a result with one row per file (in input order), each with
+        `url` (the minted `<base>/uploads/{sha1}` URI) and `status` (HTTP
+        status code of the shared request) bindings.
+        """
+
+    @classmethod
+    def inputSchema(cls) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "Target document URI to add the files' descriptions to.",
+                },
+                "files": {
+                    "type": "array",
+                    "description": "Files to upload.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file": {
+                                "type": "string",
+                                "description": "Absolute local file path.",
+                            },
+                            "title": {
+                                "type": "string",
+                                "description": "Title of the file (dct:title).",
+                            },
+                            "description": {
+                                "type": "string",
+                                "description": "Optional description (dct:description).",
+                            },
+                            "content_type": {
+                                "type": "string",
+                                "description": "Optional MIME-type override; auto-detected from path if absent.",
+                            },
+                        },
+                        "required": ["file", "title"],
+                    },
+                },
+            },
+            "required": ["url", "files"],
+        }
+
+    def execute(self, url: URIRef, files: Result) -> Result:
+        """Pure function: RDF/POST files from disk with RDFLib terms.
+
+        `files` rows bind `file` and `title`, and optionally `description`
+        and `content_type`, all as Literals.
+        """
+        if not isinstance(url, URIRef):
+            raise TypeError(
+                f"AddFiles.execute expects url to be URIRef, got {type(url)}"
+            )
+        if not isinstance(files, Result):
+            raise TypeError(
+                f"AddFiles.execute expects files to be Result, got {type(files)}"
+            )
+
+        uploads = []
+        for binding in files.bindings or []:
+            # Binding dict keys may be rdflib.Variable (from Graph.query) or
+            # str (from JSONResult); normalise to plain names for lookup.
+            row = {str(k): term for k, term in binding.items()}
+            file_path = row.get("file")
+            title = row.get("title")
+            description: Optional[Literal] = row.get("description")
+            content_type: Optional[Literal] = row.get("content_type")
+            if not isinstance(file_path, Literal):
+                raise TypeError(
+                    f"AddFiles.execute expects file to be Literal, got {type(file_path)}"
+                )
+            if not isinstance(title, Literal):
+                raise TypeError(
+                    f"AddFiles.execute expects title to be Literal, got {type(title)}"
+                )
+            if description is not None and not isinstance(description, Literal):
+                raise TypeError(
+                    f"AddFiles.execute expects description to be Literal or None, got {type(description)}"
+                )
+            if content_type is not None and not isinstance(content_type, Literal):
+                raise TypeError(
+                    f"AddFiles.execute expects content_type to be Literal or None, got {type(content_type)}"
+                )
+
+            path_str = str(file_path)
+            uploads.append(
+                {
+                    "file_path": path_str,
+                    "content_type": self.guess_content_type(path_str, content_type),
+                    "title": str(title),
+                    "description": str(description) if description is not None else None,
+                    "filename": Path(path_str).name,
+                }
+            )
+
+        url_str = str(url)
+        logging.info(
+            "RDF/POSTing %d files (%d bytes) to <%s>",
+            len(uploads), sum(os.path.getsize(u["file_path"]) for u in uploads), url_str,
+        )
+
+        response, sha1s = self.client.add_files(target_url=url_str, files=uploads)
+
+        status = Literal(response.status, datatype=XSD.integer)
+        bindings = [
+            {"status": status, "url": URIRef(self.upload_uri(url_str, sha1))}
+            for sha1 in sha1s
+        ]
+
+        logging.info("AddFiles status %s → %d files", response.status, len(bindings))
+
+        return JSONResult(vars=["status", "url"], bindings=bindings)
+
+    def execute_json(self, arguments: dict, variable_stack: list = []) -> Result:
+        """JSON execution: process arguments with strict type checking."""
+        url_data = Operation.process_json(
+            self.settings, arguments["url"], self.context, variable_stack
+        )
+        if not isinstance(url_data, URIRef):
+            raise TypeError(
+                f"ldh-AddFiles expects 'url' to be URIRef, got {type(url_data)}"
+            )
+
+        files_data = Operation.process_json(
+            self.settings, arguments["files"], self.context, variable_stack
+        )
+        # Either a Result from an upstream op (e.g. SELECT) or an inline list
+        # of file objects, which becomes a Result with one row per file.
+        if isinstance(files_data, list):
+            files_data = JSONResult(
+                vars=["file", "title", "description", "content_type"],
+                bindings=files_data,
+            )
+        if not isinstance(files_data, Result):
+            raise TypeError(
+                f"ldh-AddFiles expects 'files' to be Result or list, got {type(files_data)}"
+            )
+
+        return self.execute(url_data, files_data)
+
+    def mcp_run(self, arguments: dict, context: Any = None) -> Any:
+        """MCP execution: plain args → plain results."""
+        url = URIRef(arguments["url"])
+        files = JSONResult(
+            vars=["file", "title", "description", "content_type"],
+            bindings=[
+                {
+                    key: Literal(value, datatype=XSD.string)
+                    for key, value in file.items()
+                }
+                for file in arguments["files"]
+            ],
+        )
+
+        result = self.execute(url, files)
+        urls = ", ".join(str(row["url"]) for row in result.bindings)
+        return [types.TextContent(type="text", text=f"Files added: {urls}")]
@@ -2,9 +2,25 @@ from typing import Any, Optional
 import logging
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
+from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.post import POST
 
+# JSON-LD context and the fixed sd:supportedLanguage values shared by every
+# service description; only read when the document is parsed, never mutated.
+_CONTEXT = {
+    "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
+    "dh": "https://www.w3.org/ns/ldt/document-hierarchy#",
+    "a": "https://w3id.org/atomgraph/core#",
+    "dct": "http://purl.org/dc/terms/",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "sd": "http://www.w3.org/ns/sparql-service-description#",
+}
+_SUPPORTED_LANGUAGES = [
+    {"@id": "sd:SPARQL11Query"},
+    {"@id": "sd:SPARQL11Update"},
+]
+
 
 class AddGenericService(POST):
     @classmethod
@@ -213,22 +229,12 @@ class AddGenericService(POST):
 
         # Build JSON-LD structure for the service description - matching shell script output
         data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dh": "https://www.w3.org/ns/ldt/document-hierarchy#",
-                "a": "https://w3id.org/atomgraph/core#",
-                "dct": "http://purl.org/dc/terms/",
-                "foaf": "http://xmlns.com/foaf/0.1/",
-                "sd": "http://www.w3.org/ns/sparql-service-description#",
-            },
+            "@context": _CONTEXT,
             "@id": subject_id,
             "@type": "sd:Service",
             "dct:title": title_str,
             "sd:endpoint": {"@id": endpoint_str},
-            "sd:supportedLanguage": [
-                {"@id": "sd:SPARQL11Query"},
-                {"@id": "sd:SPARQL11Update"},
-            ],
+            "sd:supportedLanguage": _SUPPORTED_LANGUAGES,
         }
 
         # Add optional properties - matching shell script conditional logic
@@ -252,8 +258,6 @@ class AddGenericService(POST):
 
     def mcp_run(self, arguments: dict, context: Any = None) -> Any:
         """MCP execution: plain args → plain results"""
-        from mcp import types
-
         # Convert plain arguments to RDFLib terms
         url = URIRef(arguments["url"])
         endpoint = URIRef(arguments["endpoint"])
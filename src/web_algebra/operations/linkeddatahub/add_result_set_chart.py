@@ -2,9 +2,17 @@ from typing import Any, Optional
 import logging
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
+from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.post import POST
 
+# JSON-LD context of the chart document; built once, never mutated
+_CONTEXT = {
+    "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
+    "dct": "http://purl.org/dc/terms/",
+    "spin": "http://spinrdf.org/spin#",
+}
+
 
 class AddResultSetChart(POST):
     @classmethod
@@ -232,11 +240,7 @@ class AddResultSetChart(POST):
 
         # Build JSON-LD structure for the chart - matching shell script output
         data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dct": "http://purl.org/dc/terms/",
-                "spin": "http://spinrdf.org/spin#",
-            },
+            "@context": _CONTEXT,
             "@id": subject_id,
             "@type": "ldh:ResultSetChart",
             "dct:title": title_str,
@@ -258,8 +262,6 @@ class AddResultSetChart(POST):
 
     def mcp_run(self, arguments: dict, context: Any = None) -> Any:
         """MCP execution: plain args → plain results"""
-        from mcp import types
-
         # Convert plain arguments to RDFLib terms
         url = URIRef(arguments["url"])
         query = URIRef(arguments["query"])
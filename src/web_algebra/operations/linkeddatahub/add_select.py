@@ -2,9 +2,17 @@ from typing import Any, Optional
 import logging
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
+from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.post import POST
 
+# JSON-LD context of the query document; built once, never mutated
+_CONTEXT = {
+    "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
+    "dct": "http://purl.org/dc/terms/",
+    "sp": "http://spinrdf.org/sp#",
+}
+
 
 class AddSelect(POST):
     @classmethod
@@ -175,11 +183,7 @@ class AddSelect(POST):
 
         # Build JSON-LD structure for the SELECT query - matching shell script output
         data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dct": "http://purl.org/dc/terms/",
-                "sp": "http://spinrdf.org/sp#",
-            },
+            "@context": _CONTEXT,
             "@id": subject_id,
             "@type": "sp:Select",
             "dct:title": title_str,
@@ -201,8 +205,6 @@ class AddSelect(POST):
 
     def mcp_run(self, arguments: dict, context: Any = None) -> Any:
         """MCP execution: plain args → plain results"""
-        from mcp import types
-
         # Convert plain arguments to RDFLib terms
         url = URIRef(arguments["url"])
         query = Literal(arguments["query"], datatype=XSD.string)
@@ -2,9 +2,17 @@ from typing import Any, Optional
 import logging
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
+from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.post import POST
 
+# JSON-LD context of the view document; built once, never mutated
+_CONTEXT = {
+    "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
+    "dct": "http://purl.org/dc/terms/",
+    "spin": "http://spinrdf.org/spin#",
+}
+
 
 class AddView(POST):
     @classmethod
@@ -195,11 +203,7 @@ class AddView(POST):
 
         # Build JSON-LD structure for the view - matching shell script output
         data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dct": "http://purl.org/dc/terms/",
-                "spin": "http://spinrdf.org/spin#",
-            },
+            "@context": _CONTEXT,
             "@id": subject_id,
             "@type": "ldh:View",
             "dct:title": title_str,
@@ -223,8 +227,6 @@ class AddView(POST):
 
     def mcp_run(self, arguments: dict, context: Any = None) -> Any:
         """MCP execution: plain args → plain results"""
-        from mcp import types
-
         # Convert plain arguments to RDFLib terms
         url = URIRef(arguments["url"])
         query = URIRef(arguments["query"])
@@ -1,11 +1,21 @@
 from typing import Any
 import logging
+import json
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
+from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.post import POST
 from web_algebra.operations.linked_data.get import GET
 
+# JSON-LD context of the object block document; built once, never mutated
+_CONTEXT = {
+    "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
+    "dct": "http://purl.org/dc/terms/",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "ac": "https://w3id.org/atomgraph/client#",
+}
+
 
 class AddObjectBlock(POST):
     @classmethod
@@ -197,8 +207,6 @@ class AddObjectBlock(POST):
         graph = get_op.execute(url)
 
         # Convert Graph to JSON-LD for processing
-        import json
-
         jsonld_str = graph.serialize(format="json-ld")
         doc = json.loads(jsonld_str)
 
@@ -240,12 +248,7 @@ class AddObjectBlock(POST):
 
         # Step 5: Build JSON-LD structure for the object block
         data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dct": "http://purl.org/dc/terms/",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "ac": "https://w3id.org/atomgraph/client#",
-            },
+            "@context": _CONTEXT,
             "@id": url_str,
         }
 
@@ -277,8 +280,6 @@ class AddObjectBlock(POST):
 
     def mcp_run(self, arguments: dict, context: Any = None) -> Any:
         """MCP execution: plain args → plain results"""
-        from mcp import types
-
         # Convert plain arguments to RDFLib terms
         url = URIRef(arguments["url"])
         value = URIRef(arguments["value"])
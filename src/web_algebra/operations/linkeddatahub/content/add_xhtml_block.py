@@ -1,11 +1,20 @@
 from typing import Any, Optional
 import logging
+import json
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD, RDF
+from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.post import POST
 from web_algebra.operations.linked_data.get import GET
 
+# JSON-LD context of the XHTML block document; built once, never mutated
+_CONTEXT = {
+    "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
+    "dct": "http://purl.org/dc/terms/",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+}
+
 
 class AddXHTMLBlock(POST):
     @classmethod
@@ -171,8 +180,6 @@ class AddXHTMLBlock(POST):
         graph = get_op.execute(url)
 
         # Convert Graph to JSON-LD for processing
-        import json
-
         jsonld_str = graph.serialize(format="json-ld")
         doc = json.loads(jsonld_str)
 
@@ -214,11 +221,7 @@ class AddXHTMLBlock(POST):
 
         # Step 5: Build JSON-LD structure for the XHTML block
         data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dct": "http://purl.org/dc/terms/",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-            },
+            "@context": _CONTEXT,
             "@id": url_str,
         }
 
@@ -247,8 +250,6 @@ class AddXHTMLBlock(POST):
 
     def mcp_run(self, arguments: dict, context: Any = None) -> Any:
         """MCP execution: plain args → plain results"""
-        from mcp import types
-
         # Convert plain arguments to RDFLib terms
         url = URIRef(arguments["url"])
         value = Literal(arguments["value"], datatype=RDF.XMLLiteral)
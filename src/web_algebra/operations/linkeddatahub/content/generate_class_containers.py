@@ -1,5 +1,7 @@
 import logging
-from rdflib import URIRef, Literal, Namespace, Graph
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from rdflib import URIRef, Literal, Graph
 from rdflib.namespace import RDF, RDFS, XSD, DCTERMS
 from rdflib.query import Result
 from web_algebra.operation import Operation
@@ -7,6 +9,10 @@ from web_algebra.operations.linkeddatahub.create_item import CreateItem
 from web_algebra.operations.linked_data.post import POST
 from web_algebra.operations.linkeddatahub.content.add_object_block import AddObjectBlock
 from web_algebra.json_result import JSONResult
+from web_algebra.operations.linkeddatahub.vocab import AC, LDH, SP, SPIN
+
+# Upper bound on classes processed concurrently, to avoid overwhelming LDH
+_MAX_WORKERS = 8
 
 
 class GenerateClassContainers(Operation):
@@ -19,6 +25,9 @@ class GenerateClassContainers(Operation):
     4. Adds an object block to surface the view in the item
 
     This operation orchestrates actual HTTP operations to set up the portal structure.
+    Classes are processed concurrently (at most 8 at a time); the steps for a
+    single class still run in order. Classes sharing a local name get
+    distinct item slugs ("Person", "Person-2", ...) in class order.
     """
 
     @classmethod
@@ -78,12 +87,6 @@ class GenerateClassContainers(Operation):
             raise TypeError(
                 f"GenerateClassContainers operation expects 'endpoint' to be URIRef, got {type(endpoint)}"
             )
-        # Define namespaces
-        LDH = Namespace("https://w3id.org/atomgraph/linkeddatahub#")
-        SP = Namespace("http://spinrdf.org/sp#")
-        SPIN = Namespace("http://spinrdf.org/spin#")
-        AC = Namespace("https://w3id.org/atomgraph/client#")
-
         # Query to find all classes in the ontology
         query = """
         PREFIX owl: <http://www.w3.org/2002/07/owl#>
@@ -98,69 +101,98 @@ class GenerateClassContainers(Operation):
 
         results = ontology.query(query)
 
-        # Collect all operation results and track unique variables
-        all_bindings = []
-        all_vars = set()
-
-        # Create container for each class
-        for row in results:
-            row_dict = row.asdict()
-            class_uri = row_dict["class"]
+        class_uris = []
+        for (class_uri,) in results:
 
             # Validate
             if not isinstance(class_uri, URIRef):
                 raise TypeError(f"Expected class to be URIRef, got {type(class_uri)}")
 
-            # Extract local name for URI
-            class_local = self._get_local_name(class_uri)
-
-            logging.info(f"Creating item for class {class_uri}")
-
-            # Step 1: Create item
-            title = Literal(f"{class_local} instances", datatype=XSD.string)
-            slug = Literal(class_local, datatype=XSD.string)
-
-            create_result = CreateItem(settings=self.settings, context=self.context).execute(
-                parent_container, title, slug
-            )
+            class_uris.append(class_uri)
+
+        # Items are addressed by the class's local name, which classes from
+        # different namespaces can share; their concurrent PUTs would race for
+        # the same item. Later classes (in class order) get a numeric suffix.
+        slugs = []
+        taken = set()
+        for class_uri in class_uris:
+            local_name = self._get_local_name(class_uri)
+            slug, n = local_name, 1
+            while slug in taken:
+                n += 1
+                slug = f"{local_name}-{n}"
+            if slug != local_name:
+                logging.warning(
+                    "Class %s shares its local name with an earlier class; using slug %s",
+                    class_uri, slug,
+                )
+            taken.add(slug)
+            slugs.append(slug)
+
+        # Each class's steps depend on one another (the item must exist before
+        # anything is POSTed to it), but different classes are independent, so
+        # classes are processed concurrently on a bounded pool. map() keeps the
+        # results in class order.
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            class_results = list(executor.map(
+                lambda class_uri, slug: self._create_class_container(
+                    class_uri, slug, parent_container, service_uri
+                ),
+                class_uris,
+                slugs,
+            ))
+
+        # Concatenate all operation results; vars are deduplicated in
+        # first-seen order
+        results = list(chain.from_iterable(class_results))
+        all_bindings = list(chain.from_iterable(r.bindings for r in results))
+        all_vars = list(dict.fromkeys(chain.from_iterable(r.vars for r in results)))
+
+        return JSONResult(all_vars, all_bindings)
+
+    def _create_class_container(self, class_uri: URIRef, slug: str, parent_container: URIRef,
+                                service_uri: URIRef) -> list[Result]:
+        """Create the item, query, view and object block for one class"""
+        # Extract local name for titles
+        class_local = self._get_local_name(class_uri)
+
+        logging.info("Creating item for class %s", class_uri)
+
+        # Step 1: Create item
+        title = Literal(f"{class_local} instances", datatype=XSD.string)
+        slug = Literal(slug, datatype=XSD.string)
+
+        create_result = CreateItem(settings=self.settings, context=self.context).execute(
+            parent_container, title, slug
+        )
 
-            all_bindings.extend(create_result.bindings)
-            all_vars.update(create_result.vars)
-
-            item_uri = URIRef(create_result.bindings[0]["url"])
-            logging.info(f"Created item at {item_uri}")
-
-            # Step 2: POST sp:Select query
-            query_uri = URIRef(f"{item_uri}#Instances_Query")
-            sparql_text = self._generate_instance_query(class_uri)
-
-            query_graph = self._build_query_graph(query_uri, class_local, sparql_text, service_uri, LDH, SP)
-            post_query_result = POST(settings=self.settings, context=self.context).execute(item_uri, query_graph)
-            all_bindings.extend(post_query_result.bindings)
-            all_vars.update(post_query_result.vars)
-            logging.info(f"Posted query to {item_uri}")
-
-            # Step 3: POST ldh:View
-            view_uri = URIRef(f"{item_uri}#Instances_View")
-            view_graph = self._build_view_graph(view_uri, class_local, query_uri, service_uri, LDH, SP, AC, SPIN)
-            post_view_result = POST(settings=self.settings, context=self.context).execute(item_uri, view_graph)
-            all_bindings.extend(post_view_result.bindings)
-            all_vars.update(post_view_result.vars)
-            logging.info(f"Posted view to {item_uri}")
-
-            # Step 4: Add object block to surface the view in the item
-            add_block_result = AddObjectBlock(settings=self.settings, context=self.context).execute(
-                url=item_uri,
-                value=view_uri,
-                title=Literal(f"All {class_local}", datatype=XSD.string),
-                fragment=Literal("InstancesBlock", datatype=XSD.string)
-            )
-            all_bindings.extend(add_block_result.bindings)
-            all_vars.update(add_block_result.vars)
-            logging.info(f"Added object block to {item_uri}")
+        item_uri = URIRef(create_result.bindings[0]["url"])
+        logging.info("Created item at %s", item_uri)
+
+        # Step 2: POST sp:Select query
+        query_uri = URIRef(f"{item_uri}#Instances_Query")
+        sparql_text = self._generate_instance_query(class_uri)
+
+        query_graph = self._build_query_graph(query_uri, class_local, sparql_text, service_uri)
+        post_query_result = POST(settings=self.settings, context=self.context).execute(item_uri, query_graph)
+        logging.info("Posted query to %s", item_uri)
+
+        # Step 3: POST ldh:View
+        view_uri = URIRef(f"{item_uri}#Instances_View")
+        view_graph = self._build_view_graph(view_uri, class_local, query_uri, service_uri)
+        post_view_result = POST(settings=self.settings, context=self.context).execute(item_uri, view_graph)
+        logging.info("Posted view to %s", item_uri)
+
+        # Step 4: Add object block to surface the view in the item
+        add_block_result = AddObjectBlock(settings=self.settings, context=self.context).execute(
+            url=item_uri,
+            value=view_uri,
+            title=Literal(f"All {class_local}", datatype=XSD.string),
+            fragment=Literal("InstancesBlock", datatype=XSD.string)
+        )
+        logging.info("Added object block to %s", item_uri)
 
-        # Create concatenated Result using JSONResult
-        return JSONResult(list(all_vars), all_bindings)
+        return [create_result, post_query_result, post_view_result, add_block_result]
 
     def _get_local_name(self, uri: URIRef) -> str:
         """Extract local name from URI (part after # or last /)"""
@@ -183,7 +215,7 @@ WHERE {{
         return sparql
 
     def _build_query_graph(self, query_uri: URIRef, class_local: str, sparql_text: str,
-                          service_uri: URIRef, LDH, SP) -> Graph:
+                          service_uri: URIRef) -> Graph:
         """Build RDF graph for sp:Select query resource"""
         g = Graph()
         g.bind("sp", SP)
@@ -191,16 +223,19 @@ WHERE {{
         g.bind("rdfs", RDFS)
         g.bind("dct", DCTERMS)
 
-        g.add((query_uri, RDF.type, SP.Select))
-        g.add((query_uri, DCTERMS.title, Literal(f"Select {class_local} instances")))
-        g.add((query_uri, RDFS.label, Literal(f"Select {class_local} instances")))
-        g.add((query_uri, SP.text, Literal(sparql_text, datatype=XSD.string)))
-        g.add((query_uri, LDH.service, service_uri))
+        title = Literal(f"Select {class_local} instances")
+        g.addN([
+            (query_uri, RDF.type, SP.Select, g),
+            (query_uri, DCTERMS.title, title, g),
+            (query_uri, RDFS.label, title, g),
+            (query_uri, SP.text, Literal(sparql_text, datatype=XSD.string), g),
+            (query_uri, LDH.service, service_uri, g),
+        ])
 
         return g
 
     def _build_view_graph(self, view_uri: URIRef, class_local: str, query_uri: URIRef,
-                         service_uri: URIRef, LDH, SP, AC, SPIN) -> Graph:
+                         service_uri: URIRef) -> Graph:
         """Build RDF graph for ldh:View resource"""
         g = Graph()
         g.bind("ldh", LDH)
@@ -208,11 +243,13 @@ WHERE {{
         g.bind("ac", AC)
         g.bind("dct", DCTERMS)
 
-        g.add((view_uri, RDF.type, LDH.View))
-        g.add((view_uri, DCTERMS.title, Literal(f"All {class_local}")))
-        g.add((view_uri, SPIN.query, query_uri))
-        g.add((view_uri, LDH.service, service_uri))
-        g.add((view_uri, AC.mode, AC.ListMode))
+        g.addN([
+            (view_uri, RDF.type, LDH.View, g),
+            (view_uri, DCTERMS.title, Literal(f"All {class_local}"), g),
+            (view_uri, SPIN.query, query_uri, g),
+            (view_uri, LDH.service, service_uri, g),
+            (view_uri, AC.mode, AC.ListMode, g),
+        ])
 
         return g
 
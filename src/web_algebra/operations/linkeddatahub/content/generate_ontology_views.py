@@ -1,7 +1,8 @@
 import hashlib
-from rdflib import URIRef, Literal, Namespace, Graph
+from rdflib import URIRef, Literal, Graph
 from rdflib.namespace import RDF, RDFS, XSD, DCTERMS
 from web_algebra.operation import Operation
+from web_algebra.operations.linkeddatahub.vocab import AC, LDH, SP, SPIN
 
 
 class GenerateOntologyViews(Operation):
@@ -69,12 +70,6 @@ class GenerateOntologyViews(Operation):
                 f"GenerateOntologyViews operation expects 'service_uri' to be URIRef, got {type(service_uri)}"
             )
 
-        # Define namespaces
-        LDH = Namespace("https://w3id.org/atomgraph/linkeddatahub#")
-        SP = Namespace("http://spinrdf.org/sp#")
-        SPIN = Namespace("http://spinrdf.org/spin#")
-        AC = Namespace("https://w3id.org/atomgraph/client#")
-
         # Find all distinct datatype/object properties that are not owl:FunctionalProperty.
         # Views attach to properties (LDH `ldh:view` has rdfs:domain rdf:Property), so we
         # iterate by property rather than by (class, property) pair.
@@ -103,10 +98,10 @@ class GenerateOntologyViews(Operation):
         g.bind("rdf", RDF)
 
         seen_locals: set[str] = set()
+        # Collected as triples and inserted with a single addN() after the loop
+        triples: list[tuple] = []
 
-        for row in results:
-            row_dict = row.asdict()
-            property_uri = row_dict["property"]
+        for (property_uri,) in results:
 
             if not isinstance(property_uri, URIRef):
                 raise TypeError(f"Expected property to be URIRef, got {type(property_uri)}")
@@ -126,20 +121,24 @@ class GenerateOntologyViews(Operation):
 
             # Attach view to property via ldh:view (forward direction).
             # TODO: emit ldh:inverseView for selected object properties in a follow-up.
-            g.add((property_uri, LDH.view, view_uri))
-
-            # ldh:View resource
-            g.add((view_uri, RDF.type, LDH.View))
-            g.add((view_uri, DCTERMS.title, Literal(title)))
-            g.add((view_uri, SPIN.query, query_uri))
-            g.add((view_uri, AC.mode, AC.TableMode))
-
-            # sp:Select query resource
-            g.add((query_uri, RDF.type, SP.Select))
-            g.add((query_uri, DCTERMS.title, Literal(f"Select {property_local}")))
-            g.add((query_uri, RDFS.label, Literal(f"Select {property_local}")))
-            g.add((query_uri, SP.text, Literal(sparql_text, datatype=XSD.string)))
-            g.add((query_uri, LDH.service, service_uri))
+            triples.append((property_uri, LDH.view, view_uri))
+
+            select_title = Literal(f"Select {property_local}")
+            triples.extend([
+                # ldh:View resource
+                (view_uri, RDF.type, LDH.View),
+                (view_uri, DCTERMS.title, Literal(title)),
+                (view_uri, SPIN.query, query_uri),
+                (view_uri, AC.mode, AC.TableMode),
+                # sp:Select query resource
+                (query_uri, RDF.type, SP.Select),
+                (query_uri, DCTERMS.title, select_title),
+                (query_uri, RDFS.label, select_title),
+                (query_uri, SP.text, Literal(sparql_text, datatype=XSD.string)),
+                (query_uri, LDH.service, service_uri),
+            ])
+
+        g.addN((s, p, o, g) for s, p, o in triples)
 
         return g
 
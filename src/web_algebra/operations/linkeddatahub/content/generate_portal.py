@@ -1,3 +1,6 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from rdflib import URIRef, Literal
 from rdflib.namespace import XSD
 from rdflib.query import Result
@@ -9,6 +12,10 @@ from web_algebra.operations.linked_data.post import POST
 from web_algebra.operations.linkeddatahub.add_generic_service import AddGenericService
 from web_algebra.json_result import JSONResult
 
+# Fixed terms of the portal's SPARQL service resource (created at <ontology_namespace>#Service)
+_SERVICE_FRAGMENT = Literal("Service", datatype=XSD.string)
+_SERVICE_TITLE = Literal("SPARQL Service", datatype=XSD.string)
+
 
 class GeneratePortal(Operation):
     """Generates a complete LinkedDataHub portal from a SPARQL endpoint.
@@ -18,6 +25,11 @@ class GeneratePortal(Operation):
     2. GenerateOntologyViews - generates property views as a single RDF graph
     3. POST - posts the views to the ontology namespace
     4. GenerateClassContainers - creates containers for each class with instance views
+
+    Steps without a data dependency on each other (the service resource and
+    ontology extraction; then the views POST and class containers) run
+    concurrently on a small thread pool, so wall-clock time follows the
+    longest path rather than the sum of the HTTP round-trips.
     """
 
     @classmethod
@@ -64,56 +76,63 @@ class GeneratePortal(Operation):
                 f"GeneratePortal operation expects 'parent_container' to be URIRef, got {type(parent_container)}"
             )
 
-        import logging
-
-        # Step 0: Create service resource for the SPARQL endpoint
-        logging.info(f"Creating service resource for endpoint {endpoint}")
-        fragment = "Service"
-        service_result = AddGenericService(settings=self.settings, context=self.context).execute(
-            url=ontology_namespace,
-            endpoint=endpoint,
-            title=Literal("SPARQL Service", datatype=XSD.string),
-            fragment=Literal(fragment, datatype=XSD.string)
-        )
-        # Extract service URI from result - POST to URL with fragment creates resource at URL#fragment
-        service_uri = URIRef(f"{ontology_namespace}#{fragment}")
-        logging.info(f"Created service resource at {service_uri}")
-
-        # Step 1: Extract ontology
-        ontology_graph = ExtractOntology(settings=self.settings, context=self.context).execute(endpoint)
-
-        # Step 2: Generate property views (single RDF graph)
-        views_graph = GenerateOntologyViews(settings=self.settings, context=self.context).execute(
-            ontology_graph, ontology_namespace, service_uri
-        )
-
-        # Debug: print the views graph before POSTing
-        logging.info("=== Generated views graph (Turtle format) ===")
-        logging.info(views_graph.serialize(format="turtle"))
-        logging.info("=== End of views graph ===")
-
-        # Step 3: POST views to ontology namespace
-        post_views_result = POST(settings=self.settings, context=self.context).execute(ontology_namespace, views_graph)
+        # Step 0 (service resource) and Step 1 (ontology extraction) are
+        # independent HTTP round-trips, so run them concurrently. The service
+        # URI is derived from the fragment up front — POST to URL with
+        # fragment creates the resource at URL#fragment — so nothing
+        # downstream needs to wait on the service POST response itself.
+        service_uri = URIRef(f"{ontology_namespace}#{_SERVICE_FRAGMENT}")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            logging.info("Creating service resource for endpoint %s", endpoint)
+            service_future = executor.submit(
+                AddGenericService(settings=self.settings, context=self.context).execute,
+                url=ontology_namespace,
+                endpoint=endpoint,
+                title=_SERVICE_TITLE,
+                fragment=_SERVICE_FRAGMENT
+            )
+            ontology_future = executor.submit(
+                ExtractOntology(settings=self.settings, context=self.context).execute, endpoint
+            )
 
-        # Step 4: Generate class items (the global service_uri is reused across all class items)
-        class_containers_result = GenerateClassContainers(settings=self.settings, context=self.context).execute(
-            ontology_graph, parent_container, endpoint, service_uri
-        )
+            service_result = service_future.result()
+            logging.info("Created service resource at %s", service_uri)
+            ontology_graph = ontology_future.result()
 
-        # Concatenate all results
-        all_bindings = []
-        all_vars = set()
+            # Step 2: Generate property views (single RDF graph)
+            views_graph = GenerateOntologyViews(settings=self.settings, context=self.context).execute(
+                ontology_graph, ontology_namespace, service_uri
+            )
 
-        all_bindings.extend(service_result.bindings)
-        all_vars.update(service_result.vars)
+            # Debug: print the views graph before POSTing
+            # (serializing is the expensive part, so skip it when INFO is off)
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("=== Generated views graph (Turtle format) ===")
+                logging.info("%s", views_graph.serialize(format="turtle"))
+                logging.info("=== End of views graph ===")
+
+            # Step 3 (POST views to ontology namespace) and Step 4 (generate
+            # class items) write to different documents and only share the
+            # already-materialized ontology graph, so they also run concurrently
+            # (the global service_uri is reused across all class items)
+            post_views_future = executor.submit(
+                POST(settings=self.settings, context=self.context).execute, ontology_namespace, views_graph
+            )
+            class_containers_future = executor.submit(
+                GenerateClassContainers(settings=self.settings, context=self.context).execute,
+                ontology_graph, parent_container, endpoint, service_uri
+            )
 
-        all_bindings.extend(post_views_result.bindings)
-        all_vars.update(post_views_result.vars)
+            post_views_result = post_views_future.result()
+            class_containers_result = class_containers_future.result()
 
-        all_bindings.extend(class_containers_result.bindings)
-        all_vars.update(class_containers_result.vars)
+        # Concatenate all results; vars are deduplicated in first-seen order
+        results = (service_result, post_views_result, class_containers_result)
+        all_bindings = list(chain.from_iterable(r.bindings for r in results))
+        all_vars = list(dict.fromkeys(chain.from_iterable(r.vars for r in results)))
 
-        return JSONResult(list(all_vars), all_bindings)
+        return JSONResult(all_vars, all_bindings)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Result:
         """JSON execution: process arguments with strict type checking"""
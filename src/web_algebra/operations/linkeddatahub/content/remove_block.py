@@ -6,6 +6,28 @@ from rdflib.namespace import XSD
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.patch import PATCH
 
+# SPARQL UPDATE deleting the block's sequence membership (rdf:_N) and its
+# properties; `{block}` is either a specific block IRI or the `?block` variable.
+# The rdf:_N prefix is a constant string so the filter does not rebuild it
+# with concat() for every candidate ?seq; a fixed VALUES list of rdf:_1..N is
+# avoided because it would silently skip blocks past N.
+_REMOVE_BLOCK_UPDATE = """PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+
+DELETE
+{{
+    {url} ?seq {block} .
+    {block} ?p ?o .
+}}
+WHERE
+{{
+    {url} ?seq {block} .
+    FILTER(strstarts(str(?seq), "http://www.w3.org/1999/02/22-rdf-syntax-ns#_"))
+    OPTIONAL
+    {{
+        {block} ?p ?o
+    }}
+}}"""
+
 
 class RemoveBlock(PATCH):
     @classmethod
@@ -80,35 +102,18 @@ class RemoveBlock(PATCH):
                 f"RemoveBlock.execute expects block to be URIRef, got {type(block)}"
             )
 
-        url_str = str(url)
-        block_str = str(block) if block else None
-
-        logging.info("Removing block from document <%s>", url_str)
-        if block_str:
-            logging.info("Targeting specific block <%s>", block_str)
+        logging.info("Removing block from document <%s>", url)
+        if block is not None:
+            logging.info("Targeting specific block <%s>", block)
 
-        # Construct SPARQL UPDATE query
-        # If block is specified, use it as <block_uri>, otherwise use ?block variable
-        block_ref = f"<{block_str}>" if block_str else "?block"
-
-        sparql_query = f"""PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-
-DELETE
-{{
-    <{url_str}> ?seq {block_ref} .
-    {block_ref} ?p ?o .
-}}
-WHERE
-{{
-    <{url_str}> ?seq {block_ref} .
-    FILTER(strstarts(str(?seq), concat(str(rdf:), "_")))
-    OPTIONAL
-    {{
-        {block_ref} ?p ?o
-    }}
-}}"""
+        # If block is specified, use it as <block_uri>, otherwise use ?block variable.
+        # `n3()` rejects URIs containing characters that could break out of
+        # the IRIREF, so the terms are safe to splice into the template.
+        sparql_query = _REMOVE_BLOCK_UPDATE.format(
+            url=url.n3(), block=block.n3() if block is not None else "?block"
+        )
 
-        logging.info(f"SPARQL UPDATE query: {sparql_query}")
+        logging.info("SPARQL UPDATE query: %s", sparql_query)
 
         # Use parent PATCH operation to execute the SPARQL UPDATE
         return super().execute(url, Literal(sparql_query, datatype=XSD.string))
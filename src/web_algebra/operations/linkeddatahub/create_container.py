@@ -1,13 +1,18 @@
 from typing import Any, Optional
 import logging
 import urllib.parse
-from rdflib import URIRef, Literal
-from rdflib.namespace import XSD
+from rdflib import BNode, Graph, URIRef, Literal
+from rdflib.namespace import DCTERMS, RDF, XSD
 from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.put import PUT
+from web_algebra.operations.linkeddatahub.vocab import DH, LDH
 from rdflib.query import Result
 
+_DH_CONTAINER = DH.Container
+_LDH_OBJECT = LDH.Object
+_LDH_CHILDREN_VIEW = LDH.ChildrenView
+
 
 class CreateContainer(PUT):
     @classmethod
@@ -79,39 +84,31 @@ class CreateContainer(PUT):
         slug_str = urllib.parse.quote(str(slug) if slug else str(title), safe="")
 
         # Construct URL
-        parent_str = str(parent_uri)
-        if not parent_str.endswith("/"):
-            parent_str += "/"
-        url = parent_str + slug_str + "/"
+        # URIRef is a str, so no str() copy is needed
+        base = parent_uri if parent_uri.endswith("/") else f"{parent_uri}/"
+        url = f"{base}{slug_str}/"
 
         logging.info(
             "Creating LinkedDataHub Container at <%s> with title '%s'", url, title
         )
 
-        # Create JSON-LD data
-        data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dh": "https://www.w3.org/ns/ldt/document-hierarchy#",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "dct": "http://purl.org/dc/terms/",
-                "sioc": "http://rdfs.org/sioc/ns#",
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-            },
-            "@id": url,
-            "@type": "dh:Container",
-            "dct:title": str(title),
-            "rdf:_1": {"@type": "ldh:Object", "rdf:value": {"@id": "ldh:ChildrenView"}},
-        }
+        # Build the document graph directly (no JSON-LD round-trip)
+        subject = URIRef(url)
+        children_view = BNode()
+        graph = Graph()
+        graph.addN([
+            (subject, RDF.type, _DH_CONTAINER, graph),
+            (subject, DCTERMS.title, Literal(str(title)), graph),
+            (subject, RDF._1, children_view, graph),
+            (children_view, RDF.type, _LDH_OBJECT, graph),
+            (children_view, RDF.value, _LDH_CHILDREN_VIEW, graph),
+        ])
 
         if description:
-            data["dct:description"] = str(description)
-
-        # Convert the document to a Graph and call parent PUT operation
-        graph = self.to_graph(data, base=url)
+            graph.add((subject, DCTERMS.description, Literal(str(description))))
 
         # Call parent PUT execute method
-        return super().execute(URIRef(url), graph)
+        return super().execute(subject, graph)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Result:
         """JSON execution: process arguments and call pure function"""
@@ -166,12 +163,12 @@ class CreateContainer(PUT):
         parent_uri = URIRef(arguments["parent"])
         title = Literal(arguments["title"], datatype=XSD.string)
         slug = (
-            Literal(arguments.get("slug", ""), datatype=XSD.string)
+            Literal(arguments["slug"], datatype=XSD.string)
             if "slug" in arguments
             else None
         )
         description = (
-            Literal(arguments.get("description", ""), datatype=XSD.string)
+            Literal(arguments["description"], datatype=XSD.string)
             if "description" in arguments
             else None
         )
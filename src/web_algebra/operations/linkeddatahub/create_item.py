@@ -1,13 +1,16 @@
 from typing import Any, Optional
 import logging
 import urllib.parse
-from rdflib import URIRef, Literal
-from rdflib.namespace import XSD
+from rdflib import Graph, URIRef, Literal
+from rdflib.namespace import DCTERMS, RDF, XSD
 from mcp import types
 from web_algebra.operation import Operation
 from web_algebra.operations.linked_data.put import PUT
+from web_algebra.operations.linkeddatahub.vocab import DH
 from rdflib.query import Result
 
+_DH_ITEM = DH.Item
+
 
 class CreateItem(PUT):
     @classmethod
@@ -68,33 +71,22 @@ class CreateItem(PUT):
         slug_str = urllib.parse.quote(str(slug) if slug else str(title), safe="")
 
         # Construct URL
-        container_str = str(container_uri)
-        if not container_str.endswith("/"):
-            container_str += "/"
-        url = container_str + slug_str + "/"
+        # URIRef is a str, so no str() copy is needed
+        base = container_uri if container_uri.endswith("/") else f"{container_uri}/"
+        url = f"{base}{slug_str}/"
 
         logging.info("Creating LinkedDataHub Item at <%s> with title '%s'", url, title)
 
-        # Create JSON-LD data
-        data = {
-            "@context": {
-                "ldh": "https://w3id.org/atomgraph/linkeddatahub#",
-                "dh": "https://www.w3.org/ns/ldt/document-hierarchy#",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "dct": "http://purl.org/dc/terms/",
-                "sioc": "http://rdfs.org/sioc/ns#",
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-            },
-            "@id": url,
-            "@type": "dh:Item",
-            "dct:title": str(title),
-        }
-
-        # Convert the document to a Graph and call parent PUT operation
-        graph = self.to_graph(data, base=url)
+        # Build the document graph directly (no JSON-LD round-trip)
+        subject = URIRef(url)
+        graph = Graph()
+        graph.addN([
+            (subject, RDF.type, _DH_ITEM, graph),
+            (subject, DCTERMS.title, Literal(str(title)), graph),
+        ])
 
         # Call parent PUT execute method
-        return super().execute(URIRef(url), graph)
+        return super().execute(subject, graph)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Result:
         """JSON execution: process arguments with strict type checking"""
@@ -137,7 +129,7 @@ class CreateItem(PUT):
         container_uri = URIRef(arguments["container"])
         title = Literal(arguments["title"], datatype=XSD.string)
         slug = (
-            Literal(arguments.get("slug", ""), datatype=XSD.string)
+            Literal(arguments["slug"], datatype=XSD.string)
             if "slug" in arguments
             else None
         )
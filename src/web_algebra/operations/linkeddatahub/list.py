@@ -1,18 +1,19 @@
 from typing import Any
 import logging
 import json
+import textwrap
 from mcp import types
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
-from web_algebra.operations.sparql.substitute import Substitute
 from web_algebra.operations.sparql.select import SELECT
 
 
 class LDHList(Operation, MCPTool):
-    # same query as ldh:SelectChildren in ldh.ttl
-    query: str = """
+    # same query as ldh:SelectChildren in ldh.ttl; dedented once at import,
+    # as the text is sent URL-encoded with every request
+    query: str = textwrap.dedent("""
         PREFIX  dct:  <http://purl.org/dc/terms/>
         PREFIX  foaf: <http://xmlns.com/foaf/0.1/>
         PREFIX  sioc: <http://rdfs.org/sioc/ns#>
@@ -31,7 +32,10 @@ class LDHList(Operation, MCPTool):
         }
         }
         ORDER BY ?title
-    """
+    """).strip()
+
+    def model_post_init(self, __context: Any) -> None:
+        self.select = SELECT(settings=self.settings, context=self.context)
 
     @classmethod
     def name(cls):
@@ -84,16 +88,12 @@ class LDHList(Operation, MCPTool):
             "Executing ldh:List on <%s> (SPARQL endpoint: %s)", url_str, endpoint_str
         )
 
-        substitute = Substitute(settings=self.settings, context=self.context)
-        # Direct call with RDFLib terms
-        query_literal = Literal(self.query, datatype=XSD.string)
-        var_literal = Literal("this", datatype=XSD.string)
-        binding_uriref = url  # Already a URIRef
-        query = substitute.execute(query_literal, var_literal, binding_uriref)
+        # The query is fixed and only binds $this, so a plain replace is
+        # enough; no need to spin up a Substitute op and run its regex.
+        query = Literal(self.query.replace("$this", url.n3()), datatype=XSD.string)
 
-        select = SELECT(settings=self.settings, context=self.context)
         # Direct call with RDFLib terms
-        result = select.execute(endpoint, query)
+        result = self.select.execute(endpoint, query)
 
         # Convert JSONResult to dict if needed
         if hasattr(result, "to_json") and callable(result.to_json):
@@ -0,0 +1,12 @@
+"""Namespaces of the LinkedDataHub vocabularies used by the ldh-* operations.
+
+Defined once here instead of per call, so the ops share the same
+`Namespace` objects and module-level terms derived from them.
+"""
+from rdflib import Namespace
+
+LDH = Namespace("https://w3id.org/atomgraph/linkeddatahub#")
+DH = Namespace("https://www.w3.org/ns/ldt/document-hierarchy#")
+AC = Namespace("https://w3id.org/atomgraph/client#")
+SP = Namespace("http://spinrdf.org/sp#")
+SPIN = Namespace("http://spinrdf.org/spin#")
@@ -45,11 +45,18 @@ class Merge(Operation, MCPTool):
                     f"Merge operation expects graph {i} to be Graph, got {type(graph)}"
                 )
 
-        merged_graph = Graph()
+        # The union of a single graph is that graph; skip the copy
+        if len(graphs) == 1:
+            return graphs[0]
 
-        for i, graph in enumerate(graphs):
-            logging.info(f"Merging graph {i + 1}/{len(graphs)}...")
-            merged_graph += graph
+        logging.info("Merging %d graph(s)...", len(graphs))
+
+        # One bulk addN over all inputs rather than a += (and its own addN
+        # call) per graph
+        merged_graph = Graph()
+        merged_graph.addN(
+            (s, p, o, merged_graph) for graph in graphs for s, p, o in graph
+        )
 
         logging.info("Merged RDF data (%s triple(s))", len(merged_graph))
         return merged_graph
@@ -1,3 +1,4 @@
+import functools
 from typing import Any
 from urllib.parse import urljoin
 from rdflib import URIRef, Literal
@@ -6,6 +7,19 @@ from mcp import types
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
 
+# XSD is a DefinedNamespace, where attribute lookup costs ~1µs
+_XSD_STRING = XSD.string
+
+
+@functools.lru_cache(maxsize=16384)
+def _resolve(base: str, relative: str) -> URIRef:
+    """Resolve `relative` against `base`.
+
+    Cached because ForEach over a result set usually resolves the same
+    hrefs against one base; a hit also skips the URIRef construction.
+    """
+    return URIRef(urljoin(base, relative))
+
 
 class ResolveURI(Operation, MCPTool):
     """
@@ -46,10 +60,7 @@ class ResolveURI(Operation, MCPTool):
                 f"ResolveURI.execute expects relative to be Literal, got {type(relative)}"
             )
 
-        base_str = str(base)
-        relative_str = str(relative)
-        resolved_uri = urljoin(base_str, relative_str)
-        return URIRef(resolved_uri)
+        return _resolve(str(base), str(relative))
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> URIRef:
         """JSON execution: process arguments and call pure function"""
@@ -82,7 +93,7 @@ class ResolveURI(Operation, MCPTool):
     def mcp_run(self, arguments: dict, context: Any = None) -> Any:
         """MCP execution: plain args → plain results"""
         base = URIRef(arguments["base"])
-        relative = Literal(arguments["relative"], datatype=XSD.string)
+        relative = Literal(arguments["relative"], datatype=_XSD_STRING)
 
         result = self.execute(base, relative)
         return [types.TextContent(type="text", text=str(result))]
@@ -4,22 +4,7 @@ from web_algebra.operations.sparql.construct import CONSTRUCT
 from web_algebra.operation import Operation
 
 
-class ExtractClasses(CONSTRUCT):
-    @classmethod
-    def description(cls) -> str:
-        return "Extracts OWL classes from an RDF dataset."
-
-    @classmethod
-    def inputSchema(cls) -> dict:
-        return {
-            "type": "object",
-            "properties": {"endpoint": {"type": "string"}},
-            "required": ["endpoint"],
-        }
-
-    def execute(self, endpoint: URIRef) -> Graph:
-        """Pure function: extract OWL classes with RDFLib terms"""
-        query = Literal("""
+_QUERY = Literal("""
 PREFIX  owl:  <http://www.w3.org/2002/07/owl#>
 PREFIX  rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 
@@ -39,7 +24,24 @@ WHERE
       }
   }
 """, datatype=XSD.string)
-        return super().execute(endpoint, query)
+
+
+class ExtractClasses(CONSTRUCT):
+    @classmethod
+    def description(cls) -> str:
+        return "Extracts OWL classes from an RDF dataset."
+
+    @classmethod
+    def inputSchema(cls) -> dict:
+        return {
+            "type": "object",
+            "properties": {"endpoint": {"type": "string"}},
+            "required": ["endpoint"],
+        }
+
+    def execute(self, endpoint: URIRef) -> Graph:
+        """Pure function: extract OWL classes with RDFLib terms"""
+        return super().execute(endpoint, _QUERY)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Graph:
         """JSON execution: process arguments with strict type checking"""
@@ -1,32 +1,13 @@
+import re
 from rdflib import URIRef, Literal, Graph
 from rdflib.namespace import XSD
 from web_algebra.operations.sparql.construct import CONSTRUCT
 from web_algebra.operation import Operation
 
 
-class ExtractDatatypeProperties(CONSTRUCT):
-    @classmethod
-    def description(cls) -> str:
-        return "Extracts OWL datatype properties from an RDF dataset."
-
-    @classmethod
-    def inputSchema(cls) -> dict:
-        return {
-            "type": "object",
-            "properties": {"endpoint": {"type": "string"}},
-            "required": ["endpoint"],
-        }
-
-    def execute(self, endpoint: URIRef) -> Graph:
-        """Pure function: extract OWL datatype properties with RDFLib terms
-
-        Infers functional properties using closed world assumption:
-        - Counts max cardinality by examining all subjects in the dataset
-        - Creates OWL restriction with maxQualifiedCardinality
-        - When maxC = 1, property is inferred to be functional in this dataset
-        - Note: Inference based solely on present data, not formal ontology definitions
-        """
-        query = Literal("""
+# Sent URL-encoded with every request, so the full-line comments that
+# document the query here are stripped once, at import
+_QUERY = Literal(re.sub(r"(?m)^[ \t]*#.*\n", "", """
 PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 PREFIX owl: <http://www.w3.org/2002/07/owl#>
@@ -102,8 +83,32 @@ WHERE {
     BIND(BNODE() AS ?restriction)
   }
 }
-""", datatype=XSD.string)
-        return super().execute(endpoint, query)
+"""), datatype=XSD.string)
+
+
+class ExtractDatatypeProperties(CONSTRUCT):
+    @classmethod
+    def description(cls) -> str:
+        return "Extracts OWL datatype properties from an RDF dataset."
+
+    @classmethod
+    def inputSchema(cls) -> dict:
+        return {
+            "type": "object",
+            "properties": {"endpoint": {"type": "string"}},
+            "required": ["endpoint"],
+        }
+
+    def execute(self, endpoint: URIRef) -> Graph:
+        """Pure function: extract OWL datatype properties with RDFLib terms
+
+        Infers functional properties using closed world assumption:
+        - Counts max cardinality by examining all subjects in the dataset
+        - Creates OWL restriction with maxQualifiedCardinality
+        - When maxC = 1, property is inferred to be functional in this dataset
+        - Note: Inference based solely on present data, not formal ontology definitions
+        """
+        return super().execute(endpoint, _QUERY)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Graph:
         """JSON execution: process arguments with strict type checking"""
@@ -4,28 +4,7 @@ from web_algebra.operations.sparql.construct import CONSTRUCT
 from web_algebra.operation import Operation
 
 
-class ExtractObjectProperties(CONSTRUCT):
-    @classmethod
-    def description(cls) -> str:
-        return "Extracts OWL object properties from an RDF dataset."
-
-    @classmethod
-    def inputSchema(cls) -> dict:
-        return {
-            "type": "object",
-            "properties": {"endpoint": {"type": "string"}},
-            "required": ["endpoint"],
-        }
-
-    def execute(self, endpoint: URIRef) -> Graph:
-        """Pure function: extract OWL object properties with RDFLib terms
-
-        Infers functional properties using closed world assumption:
-        - Counts max cardinality per property across all subjects in the dataset
-        - When global max = 1, emits ?property a owl:FunctionalProperty
-        - Note: Inference based solely on present data, not formal ontology definitions
-        """
-        query = Literal("""
+_QUERY = Literal("""
 PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 PREFIX owl: <http://www.w3.org/2002/07/owl#>
@@ -93,7 +72,30 @@ WHERE {
   }
 }
 """, datatype=XSD.string)
-        return super().execute(endpoint, query)
+
+
+class ExtractObjectProperties(CONSTRUCT):
+    @classmethod
+    def description(cls) -> str:
+        return "Extracts OWL object properties from an RDF dataset."
+
+    @classmethod
+    def inputSchema(cls) -> dict:
+        return {
+            "type": "object",
+            "properties": {"endpoint": {"type": "string"}},
+            "required": ["endpoint"],
+        }
+
+    def execute(self, endpoint: URIRef) -> Graph:
+        """Pure function: extract OWL object properties with RDFLib terms
+
+        Infers functional properties using closed world assumption:
+        - Counts max cardinality per property across all subjects in the dataset
+        - When global max = 1, emits ?property a owl:FunctionalProperty
+        - Note: Inference based solely on present data, not formal ontology definitions
+        """
+        return super().execute(endpoint, _QUERY)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Graph:
         """JSON execution: process arguments with strict type checking"""
@@ -5,7 +5,7 @@ from rdflib.namespace import XSD
 from mcp import types
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
-from web_algebra.client import SPARQLClient
+from web_algebra.client import shared_sparql_client
 
 
 class DESCRIBE(Operation, MCPTool):
@@ -14,7 +14,7 @@ class DESCRIBE(Operation, MCPTool):
     """
 
     def model_post_init(self, __context: Any) -> None:
-        self.client = SPARQLClient(
+        self.client = shared_sparql_client(
             cert_pem_path=getattr(self.settings, "cert_pem_path", None),
             cert_password=getattr(self.settings, "cert_password", None),
             verify_ssl=False,  # Optionally disable SSL verification
@@ -53,11 +53,8 @@ class DESCRIBE(Operation, MCPTool):
             "Executing SPARQL DESCRIBE on %s with query:\n%s", endpoint_url, query_str
         )
 
-        # Execute using the SPARQL client and get JSON-LD response
-        json_ld_response = self.client.query(endpoint_url, query_str)
-
-        # Convert JSON-LD response to RDF Graph
-        return self.to_graph(json_ld_response)
+        # Execute using the SPARQL client, which parses the N-Triples response
+        return self.client.query(endpoint_url, query_str)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Graph:
         """JSON execution: process arguments and return Graph (same as execute)"""
@@ -1,12 +1,14 @@
 from typing import Any
 import logging
+import json
 from rdflib import URIRef, Literal
 from rdflib.namespace import XSD
 from rdflib.query import Result
 from mcp import types
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
-from web_algebra.client import SPARQLClient
+from web_algebra.json_result import JSONResult
+from web_algebra.client import shared_sparql_client
 
 
 class SELECT(Operation, MCPTool):
@@ -15,7 +17,7 @@ class SELECT(Operation, MCPTool):
     """
 
     def model_post_init(self, __context: Any) -> None:
-        self.client = SPARQLClient(
+        self.client = shared_sparql_client(
             cert_pem_path=getattr(self.settings, "cert_pem_path", None),
             cert_password=getattr(self.settings, "cert_password", None),
             verify_ssl=False,
@@ -63,8 +65,6 @@ class SELECT(Operation, MCPTool):
         )
 
         # Convert to JSONResult for compatibility
-        from web_algebra.json_result import JSONResult
-
         return JSONResult.from_json(sparql_json)
 
     def execute_json(self, arguments: dict, variable_stack: list = []) -> Result:
@@ -96,8 +96,6 @@ class SELECT(Operation, MCPTool):
 
         result = self.execute(endpoint, query)
 
-        import json
-
         return [
             types.TextContent(
                 type="text",
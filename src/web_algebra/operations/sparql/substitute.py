@@ -8,6 +8,8 @@ import re
 from web_algebra.mcp_tool import MCPTool
 from web_algebra.operation import Operation
 
+_POSITIONAL_PARAM = re.compile(r"\?(\s|[;,.])")
+
 
 class Substitute(Operation, MCPTool):
     """
@@ -170,11 +172,6 @@ class ParameterizedSparqlString:
             return value
         raise ValueError("Invalid RDFLib node type for parameter substitution.")
 
-    def _safe_replace(self, query, var, value):
-        safe_value = self._format_node(value)
-        pattern = re.compile(rf"([?$]{var})([^\w]|$)")
-        return pattern.sub(rf"{safe_value}\2", query)
-
     def _format_node(self, node):
         if isinstance(node, URIRef):
             return f"<{node}>"
@@ -195,10 +192,18 @@ class ParameterizedSparqlString:
 
     def to_string(self):
         query = self.command
-        for var, value in self.params.items():
-            query = self._safe_replace(query, var, value)
+        if self.params:
+            # One pass for all named parameters. The callable replacement keeps
+            # backslashes in values literal, and substituted text is never
+            # rescanned for other variables
+            formatted = {
+                var: self._format_node(value) for var, value in self.params.items()
+            }
+            pattern = re.compile(
+                r"[?$](" + "|".join(map(re.escape, formatted)) + r")(?!\w)"
+            )
+            query = pattern.sub(lambda match: formatted[match.group(1)], query)
 
-        positional_pattern = re.compile(r"\?(\s|[;,.])")
         index = 0
         adj = 0
 
@@ -211,7 +216,7 @@ class ParameterizedSparqlString:
             index += 1
             return match.group(0)
 
-        query = positional_pattern.sub(replace_positional, query)
+        query = _POSITIONAL_PARAM.sub(replace_positional, query)
 
         prefix_decls = "\n".join(
             [f"PREFIX {p}: <{u}>" for p, u in self.prefixes.items()]
@@ -1,14 +1,18 @@
 """Shared fixtures and helpers for the Web Algebra test suite.
 
 Test bodies under tests/unit/ derive from formal-semantics.md only and must not
-read implementation modules. This file is harness, not test cases — wiring up
-the registry, fixtures, and helpers may use code knowledge.
+read implementation modules. Client plumbing that the spec does not cover (HTTP
+handlers, SPARQL client) is tested against its implementation under
+tests/infrastructure/. This file is harness, not test cases — wiring up the
+registry, fixtures, and helpers may use code knowledge.
 """
 
 from __future__ import annotations
 
 import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 
@@ -63,6 +67,43 @@ def run_op(settings: LinkedDataHubSettings):
     return _run
 
 
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """Answers like a permissive LinkedDataHub: 201 to PUT, 200 to anything
+    else, with an empty N-Triples body. Every request is recorded."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _answer(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.requests.append((self.command, self.path, self.headers, body))
+        self.send_response(201 if self.command == "PUT" else 200)
+        self.send_header("Content-Type", "application/n-triples")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_PUT = do_POST = do_PATCH = _answer
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def recording_server():
+    """Local HTTP server standing in for LinkedDataHub.
+
+    `requests` holds `(method, path, headers, body)` per request, and
+    `base_url` ends with a slash.
+    """
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    httpd.requests = []
+    httpd.base_url = f"http://127.0.0.1:{httpd.server_port}/"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
 def result_to_json(result: Any) -> Any:
     """Convert a Web Algebra result to JSON-comparable Python data.
 
@@ -98,10 +139,12 @@ def to_json():
 
 
 def pytest_collection_modifyitems(config, items) -> None:
-    """Auto-tag tests under tests/unit/ as `unit`, tests/integration/ as `integration`."""
+    """Auto-tag tests under tests/unit/ as `unit`, tests/integration/ as
+    `integration`, tests/infrastructure/ as `infrastructure`."""
     root = Path(__file__).parent
     unit_dir = (root / "unit").resolve()
     integration_dir = (root / "integration").resolve()
+    infrastructure_dir = (root / "infrastructure").resolve()
     for item in items:
         item_path = Path(str(item.fspath)).resolve()
         try:
@@ -113,5 +156,11 @@ def pytest_collection_modifyitems(config, items) -> None:
         try:
             item_path.relative_to(integration_dir)
             item.add_marker(pytest.mark.integration)
+            continue
+        except ValueError:
+            pass
+        try:
+            item_path.relative_to(infrastructure_dir)
+            item.add_marker(pytest.mark.infrastructure)
         except ValueError:
             pass
@@ -0,0 +1,141 @@
+"""Tests for PooledHTTPHandler — keep-alive transport for the urllib openers (src/web_algebra/client.py).
+
+Not in formal-semantics.md (client infrastructure, not an operation).
+Behaviour spec: requests from one client reuse a pooled connection; the
+opener's redirect, error and proxy handling behave as with urllib's own
+handlers; an idempotent request survives a stale keep-alive connection.
+"""
+
+from __future__ import annotations
+
+import threading
+import urllib.error
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from rdflib import Graph, Literal, URIRef
+
+from web_algebra.client import LinkedDataClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, code: int, body: bytes = b"", **headers: str) -> None:
+        self.server.connections.add(self.client_address)
+        self.server.paths.append(self.path)
+        self.send_response(code)
+        self.send_header("Content-Type", "application/n-triples")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.served = getattr(self, "served", 0) + 1
+        if self.path == "/stale" and self.served > 1:
+            # Drop a reused connection without answering, as a server does
+            # when its keep-alive timeout races the next request
+            self.close_connection = True
+        elif self.path == "/missing":
+            self._send(404)
+        else:
+            self._send(200, b'<http://example.org/s> <http://example.org/p> "o" .\n')
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/old":
+            self._send(308, Location="/new")
+        else:
+            self._send(201)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.connections = set()
+    httpd.paths = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+@pytest.fixture
+def no_proxy_env(monkeypatch):
+    for name in ("http_proxy", "https_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+    return monkeypatch
+
+
+def _graph() -> Graph:
+    g = Graph()
+    g.add((URIRef("http://example.org/s"), URIRef("http://example.org/p"), Literal("o")))
+    return g
+
+
+class TestPooledHTTPHandler:
+    def test_reuses_connection_across_requests(self, server):
+        client = LinkedDataClient()
+        for _ in range(3):
+            assert len(client.get(_url(server, "/doc"))) == 1
+            assert client.put(_url(server, "/doc"), _graph()).status == 201
+
+        assert len(server.connections) == 1
+
+    def test_error_status_raises_http_error(self, server):
+        client = LinkedDataClient()
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            client.get(_url(server, "/missing"))
+
+        assert excinfo.value.code == 404
+
+    def test_308_redirect_resends_body(self, server):
+        client = LinkedDataClient()
+        response = client.put(_url(server, "/old"), _graph())
+
+        assert response.status == 201
+        assert response.geturl() == _url(server, "/new")
+
+    def test_connection_failure_raises_url_error(self):
+        client = LinkedDataClient()
+        with pytest.raises(urllib.error.URLError):
+            client.get("http://127.0.0.1:1/doc")
+
+    def test_stale_keep_alive_connection_is_retried(self, server):
+        client = LinkedDataClient()
+        assert len(client.get(_url(server, "/stale"))) == 1
+        assert len(client.get(_url(server, "/stale"))) == 1
+
+        assert len(server.connections) == 2
+
+    def test_requests_go_through_environment_proxy(self, server, no_proxy_env):
+        no_proxy_env.setenv("http_proxy", _url(server, ""))
+        client = LinkedDataClient()
+
+        assert len(client.get("http://example.invalid/doc")) == 1
+        assert server.paths == ["http://example.invalid/doc"]
+
+    def test_no_proxy_bypasses_proxy(self, server, no_proxy_env):
+        no_proxy_env.setenv("http_proxy", "http://127.0.0.1:1")
+        no_proxy_env.setenv("no_proxy", "127.0.0.1")
+        client = LinkedDataClient()
+
+        assert len(client.get(_url(server, "/doc"))) == 1
+
+    def test_unverified_tls_leaves_global_warning_filters_alone(self):
+        before = list(warnings.filters)
+        LinkedDataClient(verify_ssl=False)
+
+        assert warnings.filters == before
@@ -0,0 +1,67 @@
+"""Tests for SPARQLClient query handling (src/web_algebra/client.py).
+
+Not in formal-semantics.md (client infrastructure, not an operation).
+Behaviour spec: SPARQL queries can be sent from several threads at once
+(ExtractOntology runs its extractors concurrently) without corrupting the
+query parser.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+# Runs in a fresh interpreter: the parser race only happens on the first
+# parses in a process, which the rest of the suite has long since done
+_CONCURRENT_FIRST_QUERIES = textwrap.dedent(
+    """
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from rdflib import URIRef
+    from rdflib.plugins.sparql.parser import parseQuery
+
+    from web_algebra.main import LinkedDataHubSettings
+    from web_algebra.operations.schema.extract_ontology import ExtractOntology
+
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/n-triples")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    endpoint = URIRef(f"http://127.0.0.1:{httpd.server_port}/sparql")
+    ExtractOntology(settings=LinkedDataHubSettings()).execute(endpoint)
+    # The parser must still work afterwards
+    parseQuery("SELECT ?s WHERE { ?s ?p ?o }")
+    print("ok")
+    """
+)
+
+
+class TestSPARQLClientThreads:
+    def test_concurrent_first_queries_parse(self):
+        completed = subprocess.run(
+            [sys.executable, "-c", _CONCURRENT_FIRST_QUERIES],
+            capture_output=True,
+            # Same import path as this process (pytest's `pythonpath` setting)
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            text=True,
+            timeout=60,
+        )
+
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.strip() == "ok"
@@ -0,0 +1,124 @@
+"""Spec: formal-semantics.md "ldh-AddFiles - Add several files (binary) to LinkedDataHub document via a single multipart RDF/POST"
+Abstract: URI × Result → Result
+Python:   def execute(self, url: URIRef, files: Result) -> Result
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+
+import pytest
+from rdflib import Literal, URIRef
+
+from web_algebra.json_result import JSONResult
+from web_algebra.operation import Operation
+
+
+def _files(**row) -> JSONResult:
+    return JSONResult(vars=list(row), bindings=[row])
+
+
+class TestLDHAddFilesPure:
+    def test_wrong_url_type_raises(self, settings):
+        op = Operation.get("ldh-AddFiles")(settings=settings)
+        with pytest.raises(TypeError):
+            op.execute(
+                Literal("not-a-uri"),
+                _files(file=Literal("/abs/path.png"), title=Literal("Title")),
+            )
+
+    def test_wrong_files_type_raises(self, settings):
+        op = Operation.get("ldh-AddFiles")(settings=settings)
+        with pytest.raises(TypeError):
+            op.execute(URIRef("https://example.org/"), Literal("/abs/path.png"))
+
+    def test_wrong_file_path_type_raises(self, settings):
+        op = Operation.get("ldh-AddFiles")(settings=settings)
+        with pytest.raises(TypeError):
+            op.execute(
+                URIRef("https://example.org/"),
+                _files(file=URIRef("not-a-literal"), title=Literal("Title")),
+            )
+
+    def test_missing_title_raises(self, settings):
+        op = Operation.get("ldh-AddFiles")(settings=settings)
+        with pytest.raises(TypeError):
+            op.execute(
+                URIRef("https://example.org/"),
+                _files(file=Literal("/abs/path.png")),
+            )
+
+    def test_wrong_description_type_raises(self, settings):
+        op = Operation.get("ldh-AddFiles")(settings=settings)
+        with pytest.raises(TypeError):
+            op.execute(
+                URIRef("https://example.org/"),
+                _files(
+                    file=Literal("/abs/path.png"),
+                    title=Literal("Title"),
+                    description=URIRef("not-a-literal"),
+                ),
+            )
+
+
+class TestLDHAddFilesLocal:
+    """Against a local stand-in for LinkedDataHub (`recording_server`)."""
+
+    def test_files_sent_in_one_multipart_post(self, settings, recording_server, tmp_path):
+        (tmp_path / "a.txt").write_bytes(b"first file")
+        (tmp_path / "b.txt").write_bytes(b"second file")
+        url = URIRef(f"{recording_server.base_url}doc/")
+
+        op = Operation.get("ldh-AddFiles")(settings=settings)
+        result = op.execute(
+            url,
+            JSONResult(
+                vars=["file", "title"],
+                bindings=[
+                    {"file": Literal(str(tmp_path / "a.txt")), "title": Literal("A")},
+                    {"file": Literal(str(tmp_path / "b.txt")), "title": Literal("B")},
+                ],
+            ),
+        )
+
+        assert len(recording_server.requests) == 1
+        method, path, headers, body = recording_server.requests[0]
+        assert (method, path) == ("POST", "/doc/")
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert b"first file" in body
+        assert b"second file" in body
+
+        # One RDF/POST subject per file, in input order
+        subjects = re.findall(rb'name="sb"\r\n\r\n([^\r]*)', body)
+        assert subjects == [b"file0", b"file1"]
+
+        # One row per file, in input order, at the sha1-minted upload URI
+        upload = f"{recording_server.base_url}uploads/"
+        assert [str(row["url"]) for row in result.bindings] == [
+            upload + hashlib.sha1(b"first file").hexdigest(),
+            upload + hashlib.sha1(b"second file").hexdigest(),
+        ]
+        assert all(int(row["status"]) == 200 for row in result.bindings)
+
+    def test_duplicate_filenames_rejected_before_sending(self, settings, recording_server, tmp_path):
+        # LDH pairs file parts with descriptions by filename, so two files
+        # named alike cannot share a request
+        for folder in ("one", "two"):
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / "same.txt").write_bytes(folder.encode())
+
+        op = Operation.get("ldh-AddFiles")(settings=settings)
+        with pytest.raises(ValueError):
+            op.execute(
+                URIRef(f"{recording_server.base_url}doc/"),
+                JSONResult(
+                    vars=["file", "title"],
+                    bindings=[
+                        {"file": Literal(str(tmp_path / folder / "same.txt")), "title": Literal(folder)}
+                        for folder in ("one", "two")
+                    ],
+                ),
+            )
+
+        assert recording_server.requests == []
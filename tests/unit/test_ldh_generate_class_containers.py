@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import pytest
 from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import OWL, RDF
 
 from web_algebra.operation import Operation
 
@@ -34,6 +35,25 @@ class TestLDHGenerateClassContainersPure:
             op.execute(Graph(), PARENT, Literal("not-a-uri"))
 
 
+class TestLDHGenerateClassContainersLocal:
+    def test_shared_local_names_get_distinct_items(self, settings, recording_server):
+        # Two classes named "Person" in different namespaces must not be
+        # created (concurrently) at the same item URI
+        ontology = Graph()
+        for cls in ("http://a.example/ns#Person", "http://b.example/ns#Person", "http://a.example/ns#Place"):
+            ontology.add((URIRef(cls), RDF.type, OWL.Class))
+        base = recording_server.base_url
+
+        op = Operation.get("ldh-GenerateClassContainers")(settings=settings)
+        result = op.execute(
+            ontology, URIRef(base), URIRef(f"{base}sparql"), URIRef(f"{base}ns#Service")
+        )
+
+        puts = sorted(path for method, path, _, _ in recording_server.requests if method == "PUT")
+        assert puts == ["/Person-2/", "/Person/", "/Place/"]
+        assert result.vars == ["status", "url"]
+
+
 @pytest.mark.ldh
 class TestLDHGenerateClassContainersLive:
     @pytest.mark.skip(reason="UNCLEAR(spec): return type `Result` shape — what's a meaningful assertion for a side-effecting orchestration?")
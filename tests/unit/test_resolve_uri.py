@@ -43,6 +43,14 @@ class TestResolveURIPure:
         with pytest.raises(TypeError):
             op.execute(URIRef("http://example.org/base/"), URIRef("foo"))
 
+    def test_same_relative_against_different_bases(self, settings):
+        # Resolution is memoised; the cache must key on the base as well
+        op = Operation.get("ResolveURI")(settings=settings)
+        first = op.execute(URIRef("http://example.org/a/"), Literal("foo"))
+        second = op.execute(URIRef("http://example.org/b/"), Literal("foo"))
+        assert str(first) == "http://example.org/a/foo"
+        assert str(second) == "http://example.org/b/foo"
+
     @pytest.mark.skip(reason="UNCLEAR(spec): behavior when relative is itself an absolute URI")
     def test_absolute_relative(self, settings):
         pass
@@ -22,6 +22,16 @@ class TestSubstitutePure:
         )
         assert isinstance(result, Literal)
 
+    def test_backslash_in_value_is_kept(self, settings):
+        # The value must be inserted verbatim, not read as a regex template
+        op = Operation.get("Substitute")(settings=settings)
+        result = op.execute(
+            Literal("SELECT * WHERE { ?s ?p ?x }"),
+            Literal("x"),
+            Literal(r"C:\1dir"),
+        )
+        assert r'"C:\1dir"' in str(result)
+
     def test_wrong_query_type_raises(self, settings):
         op = Operation.get("Substitute")(settings=settings)
         with pytest.raises(TypeError):